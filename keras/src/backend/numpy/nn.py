@@ -977,3 +977,7 @@ def psnr(x1, x2, max_val):
     mse = np.mean(np.square(x1 - x2))
     psnr = 20 * np.log10(max_val) - 10 * np.log10(mse)
     return psnr
+
+
+def dense(*args, **kwargs):
+    raise NotImplementedError
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from keras.src import tree
@@ -67,6 +69,12 @@ def matmul(x1, x2):
         dtype = dtypes.result_type(x1.dtype, x2.dtype)
     x1 = x1.astype(dtype)
     x2 = x2.astype(dtype)
+    if x1.ndim > 2 and x2.ndim == 2:
+        # Merging the leading dimensions of x1 yields a single 2D matmul,
+        # which is faster than a matmul broadcasted over the batch dimensions
+        rows = math.prod(x1.shape[:-1])
+        outputs = np.matmul(x1.reshape(rows, x1.shape[-1]), x2)
+        return outputs.reshape(x1.shape[:-1] + x2.shape[-1:]).astype(dtype)
     return np.matmul(x1, x2).astype(dtype)
 
 
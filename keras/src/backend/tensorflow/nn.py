@@ -885,3 +885,24 @@ def psnr(x1, x2, max_val):
     mse = tf.reduce_mean(tf.square(x1 - x2))
     psnr = 20 * log10(max_val) - 10 * log10(mse)
     return psnr
+
+
+def dense(inputs, kernel, bias=None, activation=None):
+    from keras.src.backend.tensorflow.numpy import matmul
+
+    if bias is None:
+        raise NotImplementedError
+    inputs = convert_to_tensor(inputs)
+    if not inputs.dtype.is_floating:
+        raise NotImplementedError
+    kernel = convert_to_tensor(kernel)
+    bias = convert_to_tensor(bias)
+    if not inputs.dtype == kernel.dtype == bias.dtype:
+        raise NotImplementedError
+    # `tf.nn.bias_add` (rather than a broadcasted add) is what grappler and
+    # XLA pattern-match to fuse the bias and the activation into the matmul,
+    # e.g. as `_FusedMatMul`.
+    x = tf.nn.bias_add(matmul(inputs, kernel), bias)
+    if activation is not None:
+        x = activation(x)
+    return x
@@ -479,6 +479,20 @@ def matmul(x1, x2):
             output = tf.tensordot(x1, x2, axes=1)
         elif x1_shape.rank == 1:
             output = tf.tensordot(x1, x2, axes=[[0], [-2]])
+        elif x2_shape.rank == 2 and not isinstance(x1, tf.RaggedTensor):
+            # Fold the leading dimensions of x1 into the rows of a 2D matmul
+            x1_dynamic_shape = tf.shape(x1)
+            rows = tf.reduce_prod(x1_dynamic_shape[:-1])
+            output = tf.matmul(
+                tf.reshape(x1, [rows, x1_dynamic_shape[-1]]),
+                x2,
+                output_type=output_type,
+            )
+            output = tf.reshape(
+                output,
+                tf.concat([x1_dynamic_shape[:-1], tf.shape(x2)[-1:]], axis=0),
+            )
+            output.set_shape(x1_shape[:-1].concatenate(x2_shape[-1:]))
         else:
             output = tf.matmul(x1, x2, output_type=output_type)
         return tf.cast(output, result_dtype)
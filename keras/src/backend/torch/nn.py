@@ -867,3 +867,24 @@ def psnr(x1, x2, max_val):
     mse = torch.mean((x1 - x2) ** 2)
     psnr = 20 * torch.log10(max_val) - 10 * torch.log10(mse)
     return psnr
+
+
+def dense(inputs, kernel, bias=None, activation=None):
+    inputs = convert_to_tensor(inputs)
+    kernel = convert_to_tensor(kernel)
+    if bias is not None:
+        bias = convert_to_tensor(bias)
+    dtypes = {inputs.dtype, kernel.dtype}
+    if bias is not None:
+        dtypes.add(bias.dtype)
+    if len(dtypes) != 1 or not inputs.is_floating_point():
+        raise NotImplementedError
+    # TODO: torch.matmul doesn't support float16 with cpu
+    if get_device() == "cpu" and inputs.dtype == torch.float16:
+        raise NotImplementedError
+    # `tnn.linear` dispatches to `addmm`, which adds the bias in the epilogue
+    # of the matmul instead of in a separate pass over the outputs.
+    x = tnn.linear(inputs, kernel.T, bias)
+    if activation is not None:
+        x = activation(x)
+    return x
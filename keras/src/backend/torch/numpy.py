@@ -65,7 +65,7 @@ def matmul(x1, x2):
         # torch._int_mm only accepts the following conditions:
         # 1. cuda
         # 2. both inputs must have int8 dtype
-        # 3. both inputs must be 2d
+        # 3. x2 must be 2d (the leading dimensions of x1 are merged into one)
         # 4. x1.shape must be [>16, >= 16 and a multiplier of 8]
         # 5. x2.shape must be [>= 16 and a multiplier of 8, multiplier of 8]
         if get_device() != "cuda":
@@ -74,10 +74,10 @@ def matmul(x1, x2):
         x2_dtype = standardize_dtype(x2.dtype)
         if x1_dtype != "int8" or x2_dtype != "int8":
             return False
-        x1_shape = x1.shape
-        x2_shape = x2.shape
-        if x1.ndim != 2 or x2.ndim != 2:
+        if x1.ndim < 2 or x2.ndim != 2:
             return False
+        x1_shape = (math.prod(x1.shape[:-1]), x1.shape[-1])
+        x2_shape = x2.shape
         if x1_shape[0] <= 16 or x1_shape[1] < 16 or x1_shape[1] % 8 != 0:
             return False
         if x2_shape[0] < 16 or x2_shape[0] % 8 != 0 or x2_shape[1] % 8 != 0:
@@ -88,7 +88,10 @@ def matmul(x1, x2):
     # TODO: Loosen the restriction of the usage of torch._int_mm
     # TODO: We should replace torch._int_mm with the public api if possible
     if can_use_int_matmul(x1, x2):
-        return torch._int_mm(x1, x2)
+        if x1.ndim == 2:
+            return torch._int_mm(x1, x2)
+        outputs = torch._int_mm(torch.reshape(x1, (-1, x1.shape[-1])), x2)
+        return torch.reshape(outputs, x1.shape[:-1] + x2.shape[-1:])
 
     x1_dtype = standardize_dtype(x1.dtype)
     x2_dtype = standardize_dtype(x2.dtype)
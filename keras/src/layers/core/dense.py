@@ -1,6 +1,7 @@
 import ml_dtypes
 
 from keras.src import activations
+from keras.src import backend
 from keras.src import constraints
 from keras.src import dtype_policies
 from keras.src import initializers
@@ -11,6 +12,9 @@ from keras.src.api_export import keras_export
 from keras.src.layers.input_spec import InputSpec
 from keras.src.layers.layer import Layer
 
+# Number of units merged at once when folding lora weights into an int8 kernel.
+LORA_MERGE_BLOCK_SIZE = 512
+
 
 @keras_export("keras.layers.Dense")
 class Dense(Layer):
@@ -56,7 +60,9 @@ class Dense(Layer):
             trainable matrices. This can be useful to reduce the
             computation cost of fine-tuning large dense layers.
             You can also enable LoRA on an existing
-            `Dense` layer by calling `layer.enable_lora(rank)`.
+            `Dense` layer by calling `layer.enable_lora(rank)`, and
+            merge the LoRA weights back into the kernel after
+            fine-tuning by calling `layer.merge_lora()`.
 
     Input shape:
         N-D tensor with shape: `(batch_size, ..., input_dim)`.
@@ -141,13 +147,47 @@ class Dense(Layer):
         return self._kernel
 
     def call(self, inputs, training=None):
-        x = ops.matmul(inputs, self.kernel)
-        if self.bias is not None:
-            x = ops.add(x, self.bias)
+        if not self.lora_enabled:
+            try:
+                # Backends are allowed to specify (optionally) an optimized
+                # implementation that fuses the bias and the activation into
+                # the matmul. It raises NotImplementedError when that isn't
+                # feasible.
+                return backend.nn.dense(
+                    inputs,
+                    self._kernel,
+                    bias=self.bias,
+                    activation=self.activation,
+                )
+            except NotImplementedError:
+                pass
+        x = ops.matmul(inputs, self._kernel)
+        x = self._add_lora_and_bias(inputs, x)
         if self.activation is not None:
             x = self.activation(x)
         return x
 
+    def _add_lora_and_bias(self, inputs, x):
+        if self.lora_enabled:
+            # Computing `(inputs @ a) @ b` is much cheaper than merging `a @ b`
+            # into the kernel when `lora_rank` is small, and it avoids
+            # materializing a new kernel at every step.
+            lora_x = ops.matmul(inputs, self.lora_kernel_a)
+            if self.bias is not None:
+                try:
+                    # Let the backend fuse the bias into the second lora
+                    # matmul, to save a separate pass over the outputs.
+                    lora_x = backend.nn.dense(
+                        lora_x, self.lora_kernel_b, bias=self.bias
+                    )
+                    return ops.add(x, lora_x)
+                except NotImplementedError:
+                    pass
+            x = ops.add(x, ops.matmul(lora_x, self.lora_kernel_b))
+        if self.bias is not None:
+            x = ops.add(x, self.bias)
+        return x
+
     def compute_output_shape(self, input_shape):
         output_shape = list(input_shape)
         output_shape[-1] = self.units
@@ -189,6 +229,36 @@ class Dense(Layer):
         self.lora_enabled = True
         self.lora_rank = rank
 
+    def merge_lora(self):
+        """Merges the lora weights into the kernel and disables lora.
+
+        After fine-tuning, this removes the cost of the lora weights at
+        inference time: the layer goes back to a single matmul and the lora
+        weights are deleted. If the layer is int8-quantized, the merged kernel
+        is requantized, which is lossy.
+        """
+        if not self.lora_enabled:
+            raise ValueError(
+                "lora is not enabled. "
+                "Call `enable_lora(rank)` before merging the lora weights."
+            )
+        if self.quantization_mode == "float8":
+            raise NotImplementedError(
+                "Currently, `merge_lora()` doesn't support float8 quantization."
+            )
+        kernel_value, kernel_scale = self._get_kernel_with_merged_lora()
+        self._kernel.assign(kernel_value)
+        if self.quantization_mode == "int8":
+            self.kernel_scale.assign(kernel_scale)
+        else:
+            self._kernel.trainable = True
+        self._untrack_variable(self.lora_kernel_a)
+        self._untrack_variable(self.lora_kernel_b)
+        del self.lora_kernel_a
+        del self.lora_kernel_b
+        self.lora_enabled = False
+        self.lora_rank = None
+
     def save_own_variables(self, store):
         # Do nothing if the layer isn't yet built
         if not self.built:
@@ -404,18 +474,25 @@ class Dense(Layer):
             def grad_fn(*args, upstream=None):
                 if upstream is None:
                     (upstream,) = args
-                float_kernel = ops.divide(
-                    ops.cast(kernel, dtype=self.compute_dtype),
-                    kernel_scale,
+                # De-scale the upstream gradients instead of the kernel, which
+                # is usually much larger
+                float_kernel = ops.cast(kernel, dtype=self.compute_dtype)
+                inputs_grad = ops.matmul(
+                    ops.divide(upstream, kernel_scale),
+                    ops.transpose(float_kernel),
                 )
-                inputs_grad = ops.matmul(upstream, ops.transpose(float_kernel))
                 return (inputs_grad, None, None)
 
             inputs, inputs_scale = self.inputs_quantizer(inputs)
             x = ops.matmul(inputs, kernel)
-            # De-scale outputs
+            # De-scale outputs by multiplying with the reciprocal scales
             x = ops.cast(x, self.compute_dtype)
-            x = ops.divide(x, ops.multiply(inputs_scale, kernel_scale))
+            x = ops.multiply(
+                x,
+                ops.multiply(
+                    ops.reciprocal(inputs_scale), ops.reciprocal(kernel_scale)
+                ),
+            )
             return x, grad_fn
 
         x = matmul_with_inputs_gradient(
@@ -423,12 +500,7 @@ class Dense(Layer):
             ops.convert_to_tensor(self._kernel),
             ops.convert_to_tensor(self.kernel_scale),
         )
-        if self.lora_enabled:
-            lora_x = ops.matmul(inputs, self.lora_kernel_a)
-            lora_x = ops.matmul(lora_x, self.lora_kernel_b)
-            x = ops.add(x, lora_x)
-        if self.bias is not None:
-            x = ops.add(x, self.bias)
+        x = self._add_lora_and_bias(inputs, x)
         if self.activation is not None:
             x = self.activation(x)
         return x
@@ -567,20 +639,40 @@ class Dense(Layer):
         gc.collect()
 
     def _get_kernel_with_merged_lora(self):
-        if self.dtype_policy.quantization_mode is not None:
+        # float8 kernels are stored unquantized, so only int8 kernels need to
+        # be requantized.
+        if self.dtype_policy.quantization_mode == "int8":
             kernel_value = self._kernel
             kernel_scale = self.kernel_scale
-            if self.lora_enabled:
-                # Dequantize & quantize to merge lora weights into int8 kernel
-                # Note that this is a lossy compression
-                kernel_value = ops.divide(kernel_value, kernel_scale)
-                kernel_value = ops.add(
-                    kernel_value,
-                    ops.matmul(self.lora_kernel_a, self.lora_kernel_b),
-                )
-                kernel_value, kernel_scale = quantizers.abs_max_quantize(
-                    kernel_value, axis=0
-                )
-                kernel_scale = ops.squeeze(kernel_scale, axis=0)
+            # `lora_kernel_b` starts at zeros, so an untrained lora adds
+            # nothing. Skip the requantization pass in that case, which saves
+            # a full pass over the kernel when saving. This is only called
+            # eagerly, from `save_own_variables()` and `merge_lora()`.
+            if self.lora_enabled and bool(ops.any(self.lora_kernel_b)):
+                # Dequantize & requantize one block of units at a time (lossy)
+                inv_kernel_scale = ops.reciprocal(kernel_scale)
+                kernel_values = []
+                kernel_scales = []
+                for start in range(0, self.units, LORA_MERGE_BLOCK_SIZE):
+                    stop = min(start + LORA_MERGE_BLOCK_SIZE, self.units)
+                    block = ops.add(
+                        ops.multiply(
+                            kernel_value[:, start:stop],
+                            inv_kernel_scale[start:stop],
+                        ),
+                        ops.matmul(
+                            self.lora_kernel_a,
+                            self.lora_kernel_b[:, start:stop],
+                        ),
+                    )
+                    block, block_scale = quantizers.abs_max_quantize(
+                        block, axis=0
+                    )
+                    kernel_values.append(block)
+                    kernel_scales.append(ops.squeeze(block_scale, axis=0))
+                if len(kernel_values) == 1:
+                    return kernel_values[0], kernel_scales[0]
+                kernel_value = ops.concatenate(kernel_values, axis=1)
+                kernel_scale = ops.concatenate(kernel_scales, axis=0)
             return kernel_value, kernel_scale
         return self.kernel, None
@@ -1,4 +1,5 @@
 import os
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -15,6 +16,7 @@ from keras.src import saving
 from keras.src import testing
 from keras.src.backend.common import keras_tensor
 from keras.src.export import export_lib
+from keras.src.layers.core import dense
 
 
 class DenseTest(testing.TestCase, parameterized.TestCase):
@@ -205,6 +207,47 @@ class DenseTest(testing.TestCase, parameterized.TestCase):
         layer.build((None, 2))
         self.assertIsInstance(layer.bias.constraint, constraints.NonNeg)
 
+    def test_backend_dense(self):
+        x = np.random.random((2, 8)).astype("float32")
+        kernel = np.random.random((8, 4)).astype("float32")
+        bias = np.random.random((4,)).astype("float32")
+        if backend.backend() in ("jax", "numpy"):
+            # These backends always fall back to the generic implementation
+            with self.assertRaises(NotImplementedError):
+                backend.nn.dense(x, kernel, bias=bias)
+            return
+
+        outputs = backend.nn.dense(x, kernel, bias=bias, activation=ops.relu)
+        self.assertAllClose(outputs, np.maximum(x @ kernel + bias, 0))
+
+        # Mismatched dtypes
+        with self.assertRaises(NotImplementedError):
+            backend.nn.dense(x.astype("float64"), kernel, bias=bias)
+        # Integer inputs
+        with self.assertRaises(NotImplementedError):
+            backend.nn.dense(
+                x.astype("int32"),
+                kernel.astype("int32"),
+                bias=bias.astype("int32"),
+            )
+        # No bias
+        if backend.backend() == "tensorflow":
+            with self.assertRaises(NotImplementedError):
+                backend.nn.dense(x, kernel)
+        else:
+            self.assertAllClose(backend.nn.dense(x, kernel), x @ kernel)
+        # float16 on torch CPU
+        if backend.backend() == "torch":
+            from keras.src.backend.torch.core import get_device
+
+            if get_device() == "cpu":
+                with self.assertRaises(NotImplementedError):
+                    backend.nn.dense(
+                        x.astype("float16"),
+                        kernel.astype("float16"),
+                        bias=bias.astype("float16"),
+                    )
+
     @pytest.mark.requires_trainable_backend
     def test_enable_lora(self):
         layer = layers.Dense(units=16)
@@ -332,6 +375,117 @@ class DenseTest(testing.TestCase, parameterized.TestCase):
         with self.assertRaisesRegex(ValueError, "lora is already enabled"):
             layer.enable_lora(rank=2)
 
+    def test_frozen_lora_weights_updates(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        layer.enable_lora(4)
+        layer.trainable = False
+        x = np.random.random((2, 8))
+        layer(x)
+
+        # Frozen lora weights can still be assigned or set
+        layer.lora_kernel_b.assign(np.random.random((4, 16)))
+        self.assertAllClose(
+            layer(x), ops.add(ops.matmul(x, layer.kernel), layer.bias)
+        )
+        weights = layer.get_weights()
+        weights[-1] = np.random.random((4, 16))
+        layer.set_weights(weights)
+        self.assertAllClose(
+            layer(x), ops.add(ops.matmul(x, layer.kernel), layer.bias)
+        )
+
+    def test_merge_lora(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        layer.enable_lora(4)
+        layer.lora_kernel_b.assign(np.random.random((4, 16)))
+        x = np.random.random((2, 8))
+        y = layer(x)
+
+        layer.merge_lora()
+        self.assertFalse(layer.lora_enabled)
+        self.assertFalse(hasattr(layer, "lora_kernel_a"))
+        self.assertLen(layer.trainable_weights, 2)
+        self.assertLen(layer.non_trainable_weights, 0)
+        if backend.backend() == "torch":
+            self.assertLen(layer.torch_params, 2)
+        self.assertNotIn("lora_rank", layer.get_config())
+        self.assertAllClose(layer(x), y)
+
+        # The layer can be saved and reloaded as a regular dense layer
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(self.get_temp_dir(), "merged.keras")
+        model.save(temp_filepath)
+        new_model = saving.load_model(temp_filepath)
+        self.assertAllClose(new_model(x), y)
+
+        with self.assertRaisesRegex(ValueError, "lora is not enabled"):
+            layer.merge_lora()
+
+    def test_merge_lora_int8(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        layer.enable_lora(4)
+        layer.quantize("int8")
+        layer.lora_kernel_b.assign(np.random.random((4, 16)))
+        x = np.random.random((2, 8))
+        y = layer(x)
+
+        layer.merge_lora()
+        self.assertFalse(layer.lora_enabled)
+        self.assertLen(layer.trainable_weights, 1)
+        self.assertLen(layer.non_trainable_weights, 2)
+        self.assertEqual(backend.standardize_dtype(layer._kernel.dtype), "int8")
+        # Requantizing the merged kernel is lossy
+        self.assertAllClose(layer(x), y, atol=0.5)
+
+    def test_merge_lora_float8(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        layer.enable_lora(4)
+        layer.quantize("float8")
+        layer.lora_kernel_b.assign(np.random.random((4, 16)))
+
+        with self.assertRaisesRegex(
+            NotImplementedError, "doesn't support float8"
+        ):
+            layer.merge_lora()
+        self.assertTrue(layer.lora_enabled)
+
+        # The layer can still be saved, with the lora weights merged into
+        # the float kernel
+        model = models.Sequential([layer])
+        temp_filepath = os.path.join(self.get_temp_dir(), "float8.weights.h5")
+        model.save_weights(temp_filepath)
+
+    def test_merge_untrained_lora_int8(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        layer.enable_lora(4)
+        layer.quantize("int8")
+
+        # `lora_kernel_b` is still zeros, so the kernel must not be
+        # requantized.
+        kernel, kernel_scale = layer._get_kernel_with_merged_lora()
+        self.assertIs(kernel, layer._kernel)
+        self.assertIs(kernel_scale, layer.kernel_scale)
+
+    def test_merge_lora_int8_in_blocks(self):
+        layer = layers.Dense(units=16)
+        layer.build((None, 8))
+        layer.enable_lora(4)
+        layer.quantize("int8")
+        layer.lora_kernel_b.assign(np.random.random((4, 16)))
+        kernel, kernel_scale = layer._get_kernel_with_merged_lora()
+
+        # The units are merged independently, so the blocks (including a
+        # smaller trailing one) must give the same kernel.
+        with mock.patch.object(dense, "LORA_MERGE_BLOCK_SIZE", 5):
+            blocked_kernel, blocked_scale = layer._get_kernel_with_merged_lora()
+        self.assertAllClose(blocked_kernel, kernel)
+        self.assertAllClose(blocked_scale, kernel_scale)
+
     # Test quantization-related (int8 and float8) methods
 
     def test_quantize_int8(self):
@@ -384,6 +538,44 @@ class DenseTest(testing.TestCase, parameterized.TestCase):
             backend.standardize_dtype(layer.kernel_scale.dtype), "float32"
         )
 
+    @parameterized.named_parameters(
+        ("rank_2", (4, 8)),
+        ("rank_3", (2, 3, 8)),
+    )
+    @pytest.mark.requires_trainable_backend
+    def test_quantize_int8_inputs_gradient(self, input_shape):
+        layer = layers.Dense(units=16, use_bias=False)
+        layer.build((None, 8))
+        layer.quantize("int8")
+        x = random.normal(input_shape, dtype="float32")
+        dy = random.normal(input_shape[:-1] + (16,), dtype="float32")
+
+        def loss_fn(x):
+            return ops.sum(layer(x) * dy)
+
+        if backend.backend() == "tensorflow":
+            import tensorflow as tf
+
+            with tf.GradientTape() as tape:
+                tape.watch(x)
+                loss = loss_fn(x)
+            grad = tape.gradient(loss, x)
+        elif backend.backend() == "jax":
+            import jax
+
+            grad = jax.grad(loss_fn)(x)
+        elif backend.backend() == "torch":
+            x.requires_grad_(True)
+            loss_fn(x).backward()
+            grad = x.grad
+
+        float_kernel = ops.divide(
+            ops.cast(layer._kernel, "float32"), layer.kernel_scale
+        )
+        self.assertAllClose(
+            grad, ops.matmul(dy, ops.transpose(float_kernel)), atol=1e-5
+        )
+
     @parameterized.named_parameters(
         ("int8", "int8"),
         ("float8", "float8"),
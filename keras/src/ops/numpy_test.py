@@ -2050,6 +2050,11 @@ class NumpyTwoInputOpsCorretnessTest(testing.TestCase, parameterized.TestCase):
         self.assertAllClose(knp.Matmul()(x, z), np.matmul(x, z))
         self.assertAllClose(knp.Matmul()(p, x), np.matmul(p, x))
 
+        # Empty inner dimension
+        x = np.zeros([2, 3, 0])
+        y = np.zeros([0, 4])
+        self.assertAllClose(knp.matmul(x, y), np.matmul(x, y))
+
     @parameterized.named_parameters(
         named_product(
             (
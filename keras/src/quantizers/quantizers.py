@@ -139,10 +139,11 @@ def quantize_and_dequantize(inputs, scale, quantized_dtype, compute_dtype):
     quantized_dtype_max = ops.cast(
         float(ml_dtypes.finfo(quantized_dtype).max), compute_dtype
     )
-    x = ops.divide(inputs, ops.cast(scale, compute_dtype))
+    scale = ops.cast(scale, compute_dtype)
+    x = ops.divide(inputs, scale)
     x = ops.clip(x, -quantized_dtype_max, quantized_dtype_max)
     x = ops.cast(x, quantized_dtype)
 
     # Dequantize
-    x = ops.multiply(ops.cast(x, compute_dtype), ops.cast(scale, compute_dtype))
+    x = ops.multiply(ops.cast(x, compute_dtype), scale)
     return x
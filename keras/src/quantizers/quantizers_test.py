@@ -36,6 +36,38 @@ class QuantizersTest(testing.TestCase):
         # Test serialization
         self.run_class_serialization_test(quantizer)
 
+    def test_abs_max_quantize_value_range(self):
+        values = ops.array([[-2.0, -1.0, 0.0, 4.0]])
+
+        quantized_values, _ = quantizers.abs_max_quantize(values, axis=-1)
+        self.assertAllClose(quantized_values, [[-64, -32, 0, 127]])
+
+        # Values outside of the range are clipped
+        quantized_values, _ = quantizers.abs_max_quantize(
+            values, axis=-1, value_range=(0, 255), dtype="uint8"
+        )
+        self.assertAllClose(quantized_values, [[0, 0, 0, 255]])
+
+    def test_abs_max_quantize_bfloat16(self):
+        # Rounding errors in low precision can push the scaled values past
+        # the range, which must not overflow the cast
+        values = random.uniform([64, 32], minval=-1, maxval=1, seed=42)
+        values = ops.cast(values, "bfloat16")
+        quantized_values, _ = quantizers.abs_max_quantize(values, axis=-1)
+        self.assertLessEqual(ops.max(quantized_values), 127)
+        self.assertGreaterEqual(ops.min(quantized_values), -127)
+        self.assertTrue(
+            ops.all(
+                ops.greater_equal(
+                    ops.multiply(
+                        ops.cast(quantized_values, "float32"),
+                        ops.cast(values, "float32"),
+                    ),
+                    0,
+                )
+            )
+        )
+
     def test_compute_float8_scale(self):
         amax = 3.0
         scale = 4.0